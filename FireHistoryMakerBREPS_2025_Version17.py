@@ -1,215 +1,323 @@
+import datetime
+import multiprocessing
+import os
+
 import arcpy
 
+GDB = r"C:\Data\FireHistory\Fire_History_2025\Fire_History_2025_Working.gdb"
+# Scratch folder on fast local disk. Large intermediates spill to scratch file GDBs here, one per
+# worker process (memory workspaces aren't shared between processes).
+SCRATCH_FOLDER = r"C:\Data\FireHistory\Fire_History_2025\Scratch"
+VICGRID94 = 3111  # GDA94 / VicGrid94, the output coordinate system
+
+# Input feature classes in the GDB
+NPWSFireHistory = "NPWSFireHistory"
+VicShape_vg94 = "VicShape_vg94"
+# Dissolved, diced VicShape_vg94 built on first run; delete it to rebuild after VicShape_vg94 changes
+VicShape_vg94_diss = "VicShape_vg94_diss"
+DEECA_FIRE_HISTORY_TREATED = "FIRE_HISTORY_TREATED"
+ECOFIRE_NotfeasibletotreatLow = "ECOFIRE_NotfeasibletotreatLow"
+LASTLOG25 = "LASTLOG25"
+SA_FireHistory = "FIREMGT_FireHistory_GDA94"
+FRAS_FireHistory_2025 = "FRAS_FireHistory_2025"
+
 def exists(fc_name):
     return arcpy.Exists(fc_name)
 
-def add_and_calc_field(fc, field_name, field_type, calc_expr, code_block=None):
-    field_found = None
-    for f in arcpy.ListFields(fc):
-        if f.name.lower() == field_name.lower():
-            field_found = f
-            break
-    field_type_check = field_type.upper()
-    arcpy_type = field_found.type.upper() if field_found else ""
+# AddField keywords that ListFields reports under a different type name
+FIELD_TYPE_NAMES = {"TEXT": "STRING", "LONG": "INTEGER", "SHORT": "SMALLINTEGER"}
+
+# ListFields results per feature class (lower-case name -> Field), so the catalog is only read once
+_field_cache = {}
+
+def _fields(fc):
+    if fc not in _field_cache:
+        _field_cache[fc] = {f.name.lower(): f for f in arcpy.ListFields(fc)}
+    return _field_cache[fc]
+
+def ensure_field(fc, field_name, field_type):
+    # Returns the field name to write to, or None if it exists with another type
+    field_found = _fields(fc).get(field_name.lower())
     if field_found is None:
         arcpy.AddField_management(fc, field_name, field_type)
-        arcpy.CalculateField_management(fc, field_name, calc_expr, "PYTHON3", code_block if code_block else "")
-    elif arcpy_type == field_type_check or (field_type_check == "TEXT" and arcpy_type == "STRING"):
-        arcpy.CalculateField_management(fc, field_found.name, calc_expr, "PYTHON3", code_block if code_block else "")
+        _field_cache.pop(fc, None)
+        return field_name
+    field_type_check = field_type.upper()
+    arcpy_type = field_found.type.upper()
+    if arcpy_type in (field_type_check, FIELD_TYPE_NAMES.get(field_type_check)):
+        return field_found.name
+    return None
 
-def FireHistoryMakerFRAS_2025():
-    gdb = r"C:\Data\FireHistory\Fire_History_2025\Fire_History_2025_Working.gdb"
-    arcpy.env.workspace = gdb
-    arcpy.env.overwriteOutput = True
+def format_text_date(val):
+    # 'YYYY-MM-DD' text (month/day may be unpadded) -> YYYYMMDD integer, else separators stripped
+    if val is None:
+        return None
+    try:
+        return int(datetime.datetime.strptime(str(val), "%Y-%m-%d").strftime("%Y%m%d"))
+    except ValueError:
+        return int(str(val).replace('-', '').replace('/', ''))
 
-    # Input feature classes in the GDB
-    NPWSFireHistory = "NPWSFireHistory"
-    VicShape_vg94 = "VicShape_vg94"
-    DEECA_FIRE_HISTORY_TREATED = "FIRE_HISTORY_TREATED"
-    ECOFIRE_NotfeasibletotreatLow = "ECOFIRE_NotfeasibletotreatLow"
-    LASTLOG25 = "LASTLOG25"
-    SA_FireHistory = "FIREMGT_FireHistory_GDA94"
-    FRAS_FireHistory_2025 = "FRAS_FireHistory_2025"
-
-    # Use in-memory workspace for intermediates
-    nsw_fc = "in_memory\\nsw_erased"
-    deca_fc = "in_memory\\deeca_burnt"
-    mincover_fc = "in_memory\\deeca_mincover"
-    bushfires_fc = "in_memory\\deeca_bushfires"
-    burns_fc = "in_memory\\deeca_burns"
-    burns_treatable_fc = "in_memory\\deeca_burns_treatable"
-    lastlog_filter_fc = "in_memory\\lastlog_filter"
-    lastlog_dates_fc = "in_memory\\lastlog_dates"
-    lastlog_vg94_fc = "in_memory\\lastlog_vg94"
-    sa_erased_fc = "in_memory\\sa_erased"
-    merged_fc = "in_memory\\merged_firehistory"
-    merged_vg94_fc = "in_memory\\merged_firehistory_vg94"
-
-    # 1. NPWS FireHistory - remove Vic overlaps
-    arcpy.Erase_analysis(NPWSFireHistory, VicShape_vg94, nsw_fc)
-
-    # 2. DEECA: Select burnt only
-    arcpy.Select_analysis(DEECA_FIRE_HISTORY_TREATED, deca_fc, "FIRE_SEVERITY <> 'UNBURNT'")
-
-    # 3. Calculate null dates to 20230101
-    add_and_calc_field(
-        deca_fc, "START_DATE_INT", "TEXT",
-        "updateDate(!START_DATE_INT!)",
-        "def updateDate(value):\n  if value is None:\n    return '20230101'\n  else: return value"
-    )
+def add_output_fields(fc):
+    # Burn_Date and Source field names; either is None if it already exists with another type
+    return ensure_field(fc, "Burn_Date", "LONG"), ensure_field(fc, "Source", "TEXT")
 
-    # 4. Month fix (>12)
-    arcpy.CalculateField_management(
-        deca_fc, "START_DATE_INT",
-        "round_mth(!START_DATE_INT!)", "PYTHON3",
-        "def round_mth(date):\n  if isinstance(date, int): date = str(date)\n  yr = date[0:4]\n  mth = date[4:6]\n  day = date[6:8]\n  if int(mth) > 12:\n    date = yr + '12' + day\n  return int(date)"
-    )
+def output_row(value, burn_date, source, burn_field, source_field):
+    # Cursor row for [src_field, burn_field, source_field], leaving out any skipped field
+    row = [value]
+    if burn_field:
+        row.append(burn_date)
+    if source_field:
+        row.append(source)
+    return row
 
-    # 5. Add Burn_Date field (LONG) & populate from START_DATE_INT
-    add_and_calc_field(deca_fc, "Burn_Date", "LONG", "!START_DATE_INT!")
+def populate_burn_date(fc, src_field, source):
+    # Burn_Date from src_field and the constant Source, written in a single pass
+    burn_field, source_field = add_output_fields(fc)
+    if not (burn_field or source_field):
+        return
+    fields = [src_field] + [f for f in (burn_field, source_field) if f]
+    # Date fields come back from the cursor as datetimes; only TEXT sources need parsing
+    is_date_field = _fields(fc)[src_field.lower()].type in ("Date", "DateOnly")
+    with arcpy.da.UpdateCursor(fc, fields) as cursor:
+        if is_date_field:
+            for row in cursor:
+                burn_date = int(row[0].strftime("%Y%m%d")) if row[0] else None
+                cursor.updateRow(output_row(row[0], burn_date, source, burn_field, source_field))
+        else:
+            for row in cursor:
+                burn_date = format_text_date(row[0])
+                cursor.updateRow(output_row(row[0], burn_date, source, burn_field, source_field))
 
-    # 6. Select min cover >=2012 -- bushfires always included regardless of fire_cover
-    arcpy.Select_analysis(
-        deca_fc, mincover_fc,
-        "(SEASON < 2012) OR (FIRETYPE <> 'BURN') OR (SEASON >= 2012 AND FIRETYPE = 'BURN' AND (FIRE_COVER IN('30-49','50-69','70-89','90-100','UNKNOWN') OR FIRE_COVER IS NULL))"
-    )
+def clamp_month(date):
+    # YYYYMMDD integer with months > 12 rounded down to 12
+    year, month_day = divmod(date, 10000)
+    month, day = divmod(month_day, 100)
+    return year * 10000 + min(month, 12) * 100 + day
 
-    # 7. Split bushfires and burns -- includes null/blank TREATMENT_TYPE for burns
-    arcpy.Select_analysis(mincover_fc, bushfires_fc, "FIRETYPE <> 'BURN'")
-    arcpy.Select_analysis(
-        mincover_fc, burns_fc,
-        "FIRETYPE = 'BURN' AND (TREATMENT_TYPE IN('FUEL REDUCTION','ECOLOGICAL','NOT DETERMINED','OTHER') OR TREATMENT_TYPE IS NULL)"
-    )
+def populate_start_dates(fc, source):
+    # Burn_Date from START_DATE_INT (null -> 20230101, months > 12 rounded down to 12) alongside
+    # the constant Source, in a single pass. START_DATE_INT is only read: it goes back unchanged.
+    burn_field, source_field = add_output_fields(fc)
+    if not (burn_field or source_field):
+        return
+    # OID@ goes last so a malformed date can be traced back to its feature
+    fields = ["START_DATE_INT"] + [f for f in (burn_field, source_field) if f] + ["OID@"]
+    with arcpy.da.UpdateCursor(fc, fields) as cursor:
+        for row in cursor:
+            if row[0] is None:
+                date = 20230101
+            else:
+                value = str(row[0])
+                if len(value) != 8 or not value.isdigit():
+                    raise ValueError("{}: OBJECTID {} has START_DATE_INT {!r}, expected YYYYMMDD".format(fc, row[-1], row[0]))
+                date = clamp_month(int(value))
+            cursor.updateRow(output_row(row[0], date, source, burn_field, source_field) + [row[-1]])
+
+def add_attribute_indexes(fc, fields):
+    indexed = {f.name.lower() for index in arcpy.ListIndexes(fc) for f in index.fields}
+    for field in fields:
+        if field.lower() not in indexed:
+            arcpy.AddIndex_management(fc, [field], "idx_" + field.lower())
+
+def add_spatial_index(fc):
+    if not arcpy.Describe(fc).hasSpatialIndex:
+        arcpy.AddSpatialIndex_management(fc)
+
+def make_slim_layer(fc, layer_name, drop_fields, where_clause=None):
+    # Layer with drop_fields hidden, so tools reading it never copy those attributes
+    # Field names are matched case-insensitively, as the GDB does
+    drop = {name.lower() for name in drop_fields}
+    field_info = arcpy.FieldInfo()
+    for name, f in _fields(fc).items():
+        visibility = "HIDDEN" if name in drop and not f.required else "VISIBLE"
+        field_info.addField(f.name, f.name, visibility, "NONE")
+    arcpy.MakeFeatureLayer_management(fc, layer_name, where_clause, field_info=field_info)
+    return layer_name
+
+# Vertex cap per feature when dicing erase polygons
+DICE_VERTEX_LIMIT = 2000
+
+def erase_diced(in_features, erase_features, out_fc):
+    # Dice the erase polygons first so each overlay test only walks a few thousand vertices
+    diced_fc = "memory\\" + os.path.basename(out_fc) + "_mask"
+    arcpy.Dice_management(erase_features, diced_fc, DICE_VERTEX_LIMIT)
+    arcpy.analysis.PairwiseErase(in_features, diced_fc, out_fc)
+    arcpy.Delete_management(diced_fc)
+
+def prepare_vic_mask():
+    # Shared by the NPWS and SA erases, so the Victoria outline is dissolved and diced only once
+    if not exists(VicShape_vg94_diss):
+        dissolved_fc = "memory\\vicshape_dissolved"
+        arcpy.Dissolve_management(VicShape_vg94, dissolved_fc)
+        arcpy.Dice_management(dissolved_fc, VicShape_vg94_diss, DICE_VERTEX_LIMIT)
+        arcpy.Delete_management(dissolved_fc)
+    add_spatial_index(VicShape_vg94_diss)
+
+def selection_count(result):
+    # Selected feature count from a Select Layer By ... result. It is always the last output:
+    # SelectLayerByLocation returns (layer, layer names, count), SelectLayerByAttribute
+    # (layer, count). GetCount can't be used: it reports every feature when none are selected.
+    return int(result.getOutput(result.outputCount - 1))
+
+def erase_vic_overlaps(in_layer, out_fc):
+    # Only features within 10 km of Victoria go through the erase; the rest can't overlap it and
+    # are appended unchanged. The selection counts are checked before each tool because a layer
+    # with nothing selected is read as all of its features.
+    result = arcpy.SelectLayerByLocation_management(in_layer, "WITHIN_A_DISTANCE", VicShape_vg94_diss, "10 Kilometers")
+    if selection_count(result) == 0:
+        arcpy.SelectLayerByAttribute_management(in_layer, "CLEAR_SELECTION")
+        arcpy.CopyFeatures_management(in_layer, out_fc)
+        return
+    arcpy.analysis.PairwiseErase(in_layer, VicShape_vg94_diss, out_fc)
+    result = arcpy.SelectLayerByAttribute_management(in_layer, "SWITCH_SELECTION")
+    if selection_count(result) > 0:
+        arcpy.Append_management(in_layer, out_fc, "NO_TEST")
+
+def set_env(branch=None):
+    scratch_folder = os.path.join(SCRATCH_FOLDER, branch) if branch else SCRATCH_FOLDER
+    os.makedirs(scratch_folder, exist_ok=True)
+    arcpy.env.workspace = GDB
+    arcpy.env.scratchWorkspace = scratch_folder
+    # Overlay and copy outputs come out in VicGrid94, so the merged set never needs projecting
+    arcpy.env.outputCoordinateSystem = arcpy.SpatialReference(VICGRID94)
+    arcpy.env.overwriteOutput = True
 
-    # 8. Erase non-treatable burns
-    arcpy.Erase_analysis(burns_fc, ECOFIRE_NotfeasibletotreatLow, burns_treatable_fc)
+def run_nsw():
+    set_env("nsw")
+    npws_lyr = "npws_lyr"
+    nsw_fc = os.path.join(arcpy.env.scratchGDB, "nsw_erased")
 
-    # 9. Remove unwanted fields and set Source for bushfires
+    # 1. NPWS FireHistory - hide everything but EndDate, then remove Vic overlaps
+    npws_keep_fields = {"enddate", "burn_date", "source"}
+    npws_drop_fields = [name for name in _fields(NPWSFireHistory) if name not in npws_keep_fields]
+    make_slim_layer(NPWSFireHistory, npws_lyr, npws_drop_fields)
+    erase_vic_overlaps(npws_lyr, nsw_fc)
+    arcpy.Delete_management(npws_lyr)
+
+    # 2. Ensure Burn_Date and Source are set before merging (now uses EndDate)
+    populate_burn_date(nsw_fc, "EndDate", "NSW")
+    return [nsw_fc]
+
+def run_deeca():
+    set_env("deeca")
+    bushfires_lyr = "deeca_bushfires_lyr"
+    bushfires_fc = os.path.join(arcpy.env.scratchGDB, "deeca_bushfires")
+    burns_lyr = "deeca_burns_lyr"
+    burns_treatable_fc = os.path.join(arcpy.env.scratchGDB, "deeca_burns_treatable")
+
+    # Unwanted fields are hidden on the source layers, so they are never copied.
+    # START_DATE_INT stays visible until Burn_Date has been populated from it.
     bushfire_drop_fields = [
         "FIRETYPE", "SEASON", "FIRE_NO", "NAME", "START_DATE", "START_DATE_INT", "TREATMENT_TYPE", "FIRE_SEVERITY", "FIRE_COVER",
         "FIREKEY", "CREATE_DATE", "UPDATE_DATE", "AREA_HA", "METHOD", "METHOD_COMMENTS", "ACCURACY", "DSE_ID", "CFA_ID", "DISTRICT_ID",
         "Area_calc", "Centroid_x", "Centroid_y", "Shape_length_1", "Shape_area_1", "Shape_length_12", "Shape_area_12",
         "Shape_length_12_13", "Shape_area_12_13"
     ]
-    existing_bushfire_fields = [f.name for f in arcpy.ListFields(bushfires_fc)]
-    bushfire_drop = [f for f in bushfire_drop_fields if f in existing_bushfire_fields]
-    if bushfire_drop:
-        arcpy.DeleteField_management(bushfires_fc, bushfire_drop)
-    add_and_calc_field(bushfires_fc, "Source", "TEXT", '"BUSHFIRES"')
-
-    # 10. Remove unwanted fields and set Source for burns
     burns_drop_fields = bushfire_drop_fields + ["Shape_length_12_13_14", "Shape_area_12_13_14"]
-    existing_burns_fields = [f.name for f in arcpy.ListFields(burns_treatable_fc)]
-    burns_drop = [f for f in burns_drop_fields if f in existing_burns_fields]
-    if burns_drop:
-        arcpy.DeleteField_management(burns_treatable_fc, burns_drop)
-    add_and_calc_field(burns_treatable_fc, "Source", "TEXT", '"Burns"')
-
-    # 11. Logging history: filter, remove null dates, add Burn_Date (YYYYMMDD integer format)
-    arcpy.Select_analysis(LASTLOG25, lastlog_filter_fc, "SILVSYS IN('CFE','GSE','RRH','STR')")
-    arcpy.Select_analysis(lastlog_filter_fc, lastlog_dates_fc, "ENDDATE IS NOT NULL")
-    add_and_calc_field(
-        lastlog_dates_fc, "Burn_Date", "LONG",
-        "format_enddate(!ENDDATE!)",
-        """def format_enddate(val):
-            if val is None:
-                return None
-            try:
-                return int(val.strftime("%Y%m%d"))
-            except Exception:
-                try:
-                    import datetime
-                    dt = datetime.datetime.strptime(str(val), "%Y-%m-%d")
-                    return int(dt.strftime("%Y%m%d"))
-                except Exception:
-                    return int(str(val).replace('-', '').replace('/', ''))
-        """
+
+    # 1. DEECA: burnt only, split into bushfires and burns straight from the source table.
+    # Min cover >=2012 applies to burns only -- bushfires always included regardless of fire_cover.
+    # Burns include null/blank TREATMENT_TYPE and only feed the Erase, so they stay a layer.
+    make_slim_layer(
+        DEECA_FIRE_HISTORY_TREATED, bushfires_lyr,
+        [f for f in bushfire_drop_fields if f != "START_DATE_INT"],
+        "FIRE_SEVERITY <> 'UNBURNT' AND FIRETYPE <> 'BURN'"
+    )
+    arcpy.CopyFeatures_management(bushfires_lyr, bushfires_fc)
+    arcpy.Delete_management(bushfires_lyr)
+    make_slim_layer(
+        DEECA_FIRE_HISTORY_TREATED, burns_lyr,
+        [f for f in burns_drop_fields if f != "START_DATE_INT"],
+        "FIRE_SEVERITY <> 'UNBURNT' AND FIRETYPE = 'BURN'"
+        " AND ((SEASON < 2012) OR (SEASON >= 2012 AND (FIRE_COVER IN('30-49','50-69','70-89','90-100','UNKNOWN') OR FIRE_COVER IS NULL)))"
+        " AND (TREATMENT_TYPE IN('FUEL REDUCTION','ECOLOGICAL','NOT DETERMINED','OTHER') OR TREATMENT_TYPE IS NULL)"
     )
+
+    # 2. Erase non-treatable burns
+    erase_diced(burns_lyr, ECOFIRE_NotfeasibletotreatLow, burns_treatable_fc)
+    arcpy.Delete_management(burns_lyr)
+
+    # 3. Calculate null dates to 20230101, fix months (>12), populate Burn_Date (LONG) and set Source in a single pass
+    populate_start_dates(bushfires_fc, "BUSHFIRES")
+    populate_start_dates(burns_treatable_fc, "Burns")
+    return [bushfires_fc, burns_treatable_fc]
+
+def run_lastlog():
+    set_env("lastlog")
+    lastlog_lyr = "lastlog_lyr"
+    lastlog_dates_fc = os.path.join(arcpy.env.scratchGDB, "lastlog_dates")
+
+    # 1. Logging history: filter, remove null dates and unwanted fields (ENDDATE is kept for Burn_Date)
     lastlog_drop_fields = [
         "LOGHISTID", "FMA", "COUPEADD", "COMPART", "COUPENO", "BLOCK", "DECADE", "SEASON", "SILVSYS", "FORESTYPE",
-        "STARTDATE", "MAPLOGSRC", "LH_ID", "COUPE_NAME", "ENDDATE", "HARV_ORG", "HECTARES", "X_FMA", "AREASQM",
+        "STARTDATE", "MAPLOGSRC", "LH_ID", "COUPE_NAME", "HARV_ORG", "HECTARES", "X_FMA", "AREASQM",
         "X_SILVSYS", "X_BLOCK", "X_FORETYPE", "SECTION_SD"
     ]
-    existing_lastlog_fields = [f.name for f in arcpy.ListFields(lastlog_dates_fc)]
-    lastlog_drop = [f for f in lastlog_drop_fields if f in existing_lastlog_fields]
-    if lastlog_drop:
-        arcpy.DeleteField_management(lastlog_dates_fc, lastlog_drop)
-    add_and_calc_field(lastlog_dates_fc, "Source", "TEXT", '"LASTLOG25"')
-    vicgrid = arcpy.SpatialReference(3111)  # GDA94 / VicGrid94
-    arcpy.Project_management(lastlog_dates_fc, lastlog_vg94_fc, vicgrid)
-
-    # 12. SA fire history erase, add fields, delete non-geometry fields
-    arcpy.Erase_analysis(SA_FireHistory, VicShape_vg94, sa_erased_fc)
-    add_and_calc_field(sa_erased_fc, "Burn_Date", "LONG",
-        "format_firedate(!FIREDATE!)",
-        """def format_firedate(val):
-            if val is None:
-                return None
-            try:
-                return int(val.strftime("%Y%m%d"))
-            except Exception:
-                try:
-                    import datetime
-                    dt = datetime.datetime.strptime(str(val), "%Y-%m-%d")
-                    return int(dt.strftime("%Y%m%d"))
-                except Exception:
-                    return int(str(val).replace('-', '').replace('/', ''))
-        """
-    )
-    add_and_calc_field(sa_erased_fc, "Source", "TEXT", '"SA"')
+    make_slim_layer(LASTLOG25, lastlog_lyr, lastlog_drop_fields, "SILVSYS IN('CFE','GSE','RRH','STR') AND ENDDATE IS NOT NULL")
+    arcpy.CopyFeatures_management(lastlog_lyr, lastlog_dates_fc)
+    arcpy.Delete_management(lastlog_lyr)
+
+    # 2. Add Burn_Date (YYYYMMDD integer format) and set Source
+    populate_burn_date(lastlog_dates_fc, "ENDDATE", "LASTLOG25")
+    return [lastlog_dates_fc]
+
+def run_sa():
+    set_env("sa")
+    sa_lyr = "sa_lyr"
+    sa_erased_fc = os.path.join(arcpy.env.scratchGDB, "sa_erased")
+
+    # 1. SA fire history: hide non-geometry fields (FIREDATE is kept for Burn_Date), erase, add fields
     sa_drop_fields = [
-        "CAPTUREMET", "CAPTURESOU", "COMMENTS", "DATERELIAB", "FEATURESOU", "FINANCIALY", "FIREDATE", "FIREYEAR",
+        "CAPTUREMET", "CAPTURESOU", "COMMENTS", "DATERELIAB", "FEATURESOU", "FINANCIALY", "FIREYEAR",
         "HECTARES", "IMAGEINFOR", "INCIDENTNA", "INCIDENTNU", "INCIDENTTY", "SEASON"
     ]
-    existing_sa_fields = [f.name for f in arcpy.ListFields(sa_erased_fc)]
-    sa_drop = [f for f in sa_drop_fields if f in existing_sa_fields]
-    if sa_drop:
-        arcpy.DeleteField_management(sa_erased_fc, sa_drop)
-
-    # 13. NSW fire history: ensure Burn_Date and Source are set before merging (now uses EndDate)
-    add_and_calc_field(nsw_fc, "Burn_Date", "LONG",
-        "format_enddate(!EndDate!)",
-        """def format_enddate(val):
-            if val is None:
-                return None
-            try:
-                return int(val.strftime("%Y%m%d"))
-            except Exception:
-                try:
-                    import datetime
-                    dt = datetime.datetime.strptime(str(val), "%Y-%m-%d")
-                    return int(dt.strftime("%Y%m%d"))
-                except Exception:
-                    return int(str(val).replace('-', '').replace('/', ''))
-        """
-    )
-    add_and_calc_field(nsw_fc, "Source", "TEXT", '"NSW"')
+    make_slim_layer(SA_FireHistory, sa_lyr, sa_drop_fields)
+    erase_vic_overlaps(sa_lyr, sa_erased_fc)
+    arcpy.Delete_management(sa_lyr)
+    populate_burn_date(sa_erased_fc, "FIREDATE", "SA")
+    return [sa_erased_fc]
 
-    # 14. Merge all states together, project to VicGrid94, clean fields, and output final
-    arcpy.Merge_management(
-        [nsw_fc, bushfires_fc, burns_treatable_fc, lastlog_vg94_fc, sa_erased_fc],
-        merged_fc
-    )
-    arcpy.Project_management(merged_fc, merged_vg94_fc, vicgrid)
-
-    # Keep only Source, Burn_Date, and geometry fields
-    keep_fields = ["Source", "Burn_Date"]
-    geometry_fields = []
-    required_fields = ["OBJECTID", "Shape", "Shape_Area", "Shape_Length"]
-    for f in arcpy.ListFields(merged_vg94_fc):
-        if f.type.lower() in ["geometry", "shape"]:
-            geometry_fields.append(f.name)
-    keep_fields += geometry_fields
-    all_fields = [f.name for f in arcpy.ListFields(merged_vg94_fc)]
-    drop_fields = [
-        f for f in all_fields
-        if f not in keep_fields and f.upper() not in [r.upper() for r in required_fields]
-    ]
-    if drop_fields:
-        arcpy.DeleteField_management(merged_vg94_fc, drop_fields)
+# Independent preprocessing branches, in merge order. They only meet at the final Merge.
+BRANCHES = {"nsw": run_nsw, "deeca": run_deeca, "lastlog": run_lastlog, "sa": run_sa}
+
+def _dispatch(branch):
+    return BRANCHES[branch]()
+
+def FireHistoryMakerFRAS_2025():
+    set_env()
+
+    # Attribute indexes so the selection WHERE clauses in the branches are index-assisted,
+    # and spatial indexes on every overlay input. Built before the workers start reading.
+    add_attribute_indexes(DEECA_FIRE_HISTORY_TREATED, ["FIRE_SEVERITY", "FIRETYPE", "SEASON", "TREATMENT_TYPE"])
+    add_attribute_indexes(LASTLOG25, ["SILVSYS", "ENDDATE"])
+    for fc in [NPWSFireHistory, DEECA_FIRE_HISTORY_TREATED, ECOFIRE_NotfeasibletotreatLow, SA_FireHistory]:
+        add_spatial_index(fc)
+    prepare_vic_mask()
+
+    # Run NSW, DEECA, LASTLOG and SA preprocessing in parallel, one worker process each
+    with multiprocessing.Pool(len(BRANCHES)) as pool:
+        branch_outputs = pool.map(_dispatch, list(BRANCHES))
+    merge_inputs = [fc for outputs in branch_outputs for fc in outputs]
+
+    # Merge all states together into VicGrid94, keeping only Source and Burn_Date.
+    # Rows are copied with cursors into a narrow schema instead of Merge's schema reconciliation.
+    vicgrid = arcpy.SpatialReference(VICGRID94)
+    arcpy.CreateFeatureclass_management(GDB, FRAS_FireHistory_2025, "POLYGON", spatial_reference=vicgrid)
+    arcpy.AddField_management(FRAS_FireHistory_2025, "Source", "TEXT", field_length=16)
+    arcpy.AddField_management(FRAS_FireHistory_2025, "Burn_Date", "LONG")
+    merge_fields = ["SHAPE@", "Source", "Burn_Date"]
+    with arcpy.da.InsertCursor(FRAS_FireHistory_2025, merge_fields) as insert_cursor:
+        for fc in merge_inputs:
+            # Branch outputs are already VicGrid94; only project any that aren't
+            in_vicgrid = arcpy.Describe(fc).spatialReference.factoryCode == VICGRID94
+            with arcpy.da.SearchCursor(fc, merge_fields, spatial_reference=None if in_vicgrid else vicgrid) as search_cursor:
+                for row in search_cursor:
+                    insert_cursor.insertRow(row)
+            arcpy.Delete_management(fc)
 
-    # Final output only
-    arcpy.Sort_management(merged_vg94_fc, FRAS_FireHistory_2025, [["Burn_Date", "DESCENDING"]], spatial_sort_method="UR")
+    # Index Burn_Date rather than sorting the output -- read in date order with
+    # sql_clause=(None, "ORDER BY Burn_Date DESC")
+    add_attribute_indexes(FRAS_FireHistory_2025, ["Burn_Date"])
 
 if __name__ == '__main__':
     FireHistoryMakerFRAS_2025()